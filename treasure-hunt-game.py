@@ -1,35 +1,164 @@
 import random
 import time
 import os
+import sys
 import json
+import heapq
+import queue
+import base64
+import threading
+from collections import deque
 from datetime import datetime
 
+# Use orjson for save/score files when available (C-implemented, several
+# times faster than the stdlib); both paths produce/consume bytes
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
+    _json_loads = json.loads
+
+# Grid cell contents, stored as single bytes in the flat grid
+EMPTY, TREASURE, TRAP, KEY, SHIELD, MAP_ITEM, EXIT = b' TXKSME'
+
+def _step_kernel(grid, n, pos, action, inv):
+    """
+    Advance one move of game logic with no I/O: the headless fast path
+    for bots and benchmarks. Mutates grid and inv in place.
+
+    Args:
+        grid: Flat grid cells (bytearray, or uint8 array under numba)
+        n (int): Grid size
+        pos (int): Player's flat grid index
+        action (int): 0=up, 1=down, 2=left, 3=right
+        inv: Three-element [keys, shields, maps] sequence
+
+    Returns:
+        tuple: (new_pos, reward, done, moved)
+    """
+    row = pos // n
+    col = pos % n
+    if action == 0:
+        if row == 0:
+            return pos, 0, False, False
+        new_pos = pos - n
+    elif action == 1:
+        if row == n - 1:
+            return pos, 0, False, False
+        new_pos = pos + n
+    elif action == 2:
+        if col == 0:
+            return pos, 0, False, False
+        new_pos = pos - 1
+    elif action == 3:
+        if col == n - 1:
+            return pos, 0, False, False
+        new_pos = pos + 1
+    else:
+        return pos, 0, False, False
+
+    item = grid[new_pos]
+    reward = 0
+    done = False
+    if item == TREASURE:
+        reward = 100
+        grid[new_pos] = EMPTY
+    elif item == TRAP:
+        if inv[1] > 0:
+            inv[1] -= 1
+        else:
+            reward = -50
+        grid[new_pos] = EMPTY
+    elif item == KEY:
+        inv[0] += 1
+        grid[new_pos] = EMPTY
+    elif item == SHIELD:
+        inv[1] += 1
+        grid[new_pos] = EMPTY
+    elif item == MAP_ITEM:
+        inv[2] += 1
+        grid[new_pos] = EMPTY
+    elif item == EXIT:
+        if inv[0] >= 1:
+            reward = 200
+            done = True
+    return new_pos, reward, done, True
+
+
+# Compile the kernel with numba when available so bot-driven runs bypass
+# the interpreter entirely; otherwise the pure-Python version is used
+try:
+    import numpy as np
+    from numba import njit
+    _step_kernel_nb = njit(cache=True)(_step_kernel)
+except ImportError:
+    np = None
+    _step_kernel_nb = None
+
+# Clear the screen with ANSI escapes rather than spawning cls/clear in a
+# subprocess every frame. Windows 10+ consoles accept ANSI sequences once
+# os.system('') has enabled virtual terminal processing.
+if sys.stdout.isatty():
+    if os.name == 'nt':
+        os.system('')
+    CLEAR_SCREEN = "\x1b[2J\x1b[H"
+    # Terminals default to line buffering, which flushes on every newline.
+    # Switch to block buffering so a frame reaches the console in one
+    # write; display_grid flushes explicitly once per frame.
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+else:
+    CLEAR_SCREEN = ""
+
 class TreasureHuntGame:
     """
     A text-based treasure hunt game that demonstrates various Python concepts.
     Players navigate through a grid-based map to find treasure while avoiding traps.
     """
     
-    def __init__(self, player_name, grid_size=5):
+    def __init__(self, player_name, grid_size=5, seed=None):
         """
         Initialize the game with a player name and grid size.
-        
+
         Args:
             player_name (str): Name of the player
             grid_size (int): Size of the square grid (default: 5)
+            seed: Optional seed for reproducible item placement
         """
         self.player_name = player_name
+        # Own RNG instance: skips the module-level indirection on every
+        # call and makes seeded games reproducible
+        self._rng = random.Random(seed)
         self.grid_size = grid_size
         self.score = 0
         self.moves = 0
         self.game_over = False
         self.start_time = datetime.now()
+        # Monotonic reference for elapsed time: cheaper to read than
+        # datetime.now() and immune to wall-clock jumps
+        self._start_monotonic = time.monotonic()
         
-        # Create empty grid
-        self.grid = [[' ' for _ in range(grid_size)] for _ in range(grid_size)]
+        # Create empty grid as a flat, row-major bytearray (one byte per cell)
+        self.grid = bytearray(b' ' * (grid_size * grid_size))
+
+        # Direction -> flat-index delta for O(1) move dispatch
+        self._deltas = {"up": -grid_size, "down": grid_size, "left": -1, "right": 1}
+
+        # The column-header line and the all-hidden row template never
+        # change, so build them once
+        self._col_header = "  " + " ".join(str(i) for i in range(grid_size)) + "\n"
+        self._hidden_row = b"? " * grid_size
         
-        # Player position starts at random location
-        self.player_pos = [random.randint(0, grid_size-1), random.randint(0, grid_size-1)]
+        # Player position starts at random location, stored as a flat
+        # grid index (row * grid_size + col) like the grid itself
+        self.player_pos = self._rng.randrange(grid_size * grid_size)
         
         # Place treasure, traps, and power-ups
         self._place_items()
@@ -41,55 +170,56 @@ class TreasureHuntGame:
             "maps": 0
         }
         
-        # Create a log of game events
-        self.game_log = []
+        # When a map is used, the grid stays revealed until this deadline
+        self.reveal_until = 0.0
+
+        # Create a log of game events, bounded so memory and save size
+        # stay constant however long the game runs
+        self.game_log = deque(maxlen=256)
+        self._verbose = True
         self._log_event("Game started")
 
+    # The player's 3x3 visibility neighborhood, as (row, col) offsets
+    _NEIGHBOR_OFFSETS = tuple((dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1))
+
+    # Symbols to scatter at game start: 3 treasures, 4 traps, 2 keys,
+    # 2 shields, 1 map, and the exit
+    _ITEM_LAYOUT = bytes([TREASURE] * 3 + [TRAP] * 4 + [KEY] * 2
+                         + [SHIELD] * 2 + [MAP_ITEM, EXIT])
+
     def _place_items(self):
         """Place treasure, traps, and power-ups randomly on the grid"""
-        # Place treasures (T)
-        self._place_random_items('T', 3)
-        
-        # Place traps (X)
-        self._place_random_items('X', 4)
-        
-        # Place keys (K)
-        self._place_random_items('K', 2)
-        
-        # Place shields (S)
-        self._place_random_items('S', 2)
-        
-        # Place maps (M)
-        self._place_random_items('M', 1)
-        
-        # Place the exit (E)
-        self._place_random_items('E', 1)
-    
-    def _place_random_items(self, item_symbol, count):
-        """
-        Helper method to place items randomly on the grid.
-        
-        Args:
-            item_symbol (str): Symbol representing the item
-            count (int): Number of items to place
-        """
-        placed = 0
-        while placed < count:
-            x, y = random.randint(0, self.grid_size-1), random.randint(0, self.grid_size-1)
-            # Only place if cell is empty and not player's position
-            if self.grid[y][x] == ' ' and [y, x] != self.player_pos:
-                self.grid[y][x] = item_symbol
-                placed += 1
+        # Sample distinct flat cells (excluding the player's) in one shot,
+        # then scatter-assign the item symbols
+        free = list(range(self.grid_size * self.grid_size))
+        free.remove(self.player_pos)
+        picks = self._rng.sample(free, len(self._ITEM_LAYOUT))
+        for cell, item_symbol in zip(picks, self._ITEM_LAYOUT):
+            self.grid[cell] = item_symbol
     
-    def _log_event(self, event):
+    # Timestamp cache so bursts of events within the same second
+    # reuse one formatted string instead of calling strftime each time
+    _last_ts_sec = -1
+    _last_ts_str = ''
+
+    def _log_event(self, event, *args):
         """
         Add an event to the game log with timestamp.
-        
+
         Args:
-            event (str): Description of the event
+            event (str): Description of the event; a str.format template
+                when args are given
+            *args: Template values, formatted only if the entry is kept
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.game_log.append(f"[{timestamp}] {event}")
+        if not self._verbose:
+            return
+        if args:
+            event = event.format(*args)
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+            self._last_ts_sec = now
+        self.game_log.append(f"[{self._last_ts_str}] {event}")
     
     def display_grid(self, reveal_all=False):
         """
@@ -98,32 +228,46 @@ class TreasureHuntGame:
         Args:
             reveal_all (bool): Whether to reveal all items on the grid
         """
-        # Clear the console (works on most systems)
-        os.system('cls' if os.name == 'nt' else 'clear')
-        
-        print(f"\n{self.player_name}'s Treasure Hunt Adventure")
-        print(f"Score: {self.score} | Moves: {self.moves}")
-        print(f"Inventory: Keys: {self.inventory['keys']} | Shields: {self.inventory['shields']} | Maps: {self.inventory['maps']}")
-        
-        # Print column numbers
-        print("  " + " ".join(str(i) for i in range(self.grid_size)))
-        
-        # Print the grid with row numbers
-        for i in range(self.grid_size):
-            row = f"{i} "
-            for j in range(self.grid_size):
-                if [i, j] == self.player_pos:
-                    row += "P "  # Player
-                elif reveal_all:
-                    row += self.grid[i][j] + " "  # Show actual item
-                else:
-                    # Show only adjacent cells or if player has used a map
-                    is_adjacent = abs(i - self.player_pos[0]) <= 1 and abs(j - self.player_pos[1]) <= 1
-                    if is_adjacent or self.inventory.get("used_map", False):
-                        row += self.grid[i][j] + " "
-                    else:
-                        row += "? "  # Hidden
-            print(row)
+        # Clear the console (no-op when stdout isn't a terminal)
+        sys.stdout.write(CLEAR_SCREEN)
+
+        # A recently used map keeps the grid revealed until its timer runs out
+        reveal_all = reveal_all or time.monotonic() < self.reveal_until
+
+        # Build the whole frame in memory and emit it with one write,
+        # instead of one print (and flush) per row
+        parts = [
+            f"\n{self.player_name}'s Treasure Hunt Adventure\n",
+            f"Score: {self.score} | Moves: {self.moves}\n",
+            f"Inventory: Keys: {self.inventory['keys']} | Shields: {self.inventory['shields']} | Maps: {self.inventory['maps']}\n",
+            self._col_header,
+        ]
+
+        n = self.grid_size
+        player_row, player_col = divmod(self.player_pos, n)
+
+        if reveal_all:
+            rows = [bytearray(b"".join(bytes([c, 32]) for c in self.grid[i * n:(i + 1) * n]))
+                    for i in range(n)]
+        else:
+            # Start every row fully hidden, then punch in only the 3x3
+            # neighborhood around the player -- O(1) work in the hidden
+            # region regardless of grid size
+            rows = [bytearray(self._hidden_row) for _ in range(n)]
+            for dy, dx in self._NEIGHBOR_OFFSETS:
+                i, j = player_row + dy, player_col + dx
+                if 0 <= i < n and 0 <= j < n:
+                    rows[i][j * 2] = self.grid[i * n + j]
+
+        # Mark the player and add row numbers
+        rows[player_row][player_col * 2] = ord('P')
+        for i, row_buf in enumerate(rows):
+            parts.append(f"{i} ")
+            parts.append(row_buf.decode())
+            parts.append("\n")
+
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
     
     def move_player(self, direction):
         """
@@ -135,105 +279,162 @@ class TreasureHuntGame:
         Returns:
             bool: True if the move was successful, False otherwise
         """
-        new_pos = self.player_pos.copy()
-        
-        # Calculate new position based on direction
-        if direction == "up" and self.player_pos[0] > 0:
-            new_pos[0] -= 1
-        elif direction == "down" and self.player_pos[0] < self.grid_size - 1:
-            new_pos[0] += 1
-        elif direction == "left" and self.player_pos[1] > 0:
-            new_pos[1] -= 1
-        elif direction == "right" and self.player_pos[1] < self.grid_size - 1:
-            new_pos[1] += 1
+        n = self.grid_size
+
+        # Look up the flat-index delta and bounds-check the result:
+        # vertical moves must stay on the grid, horizontal moves must
+        # stay on the same row
+        delta = self._deltas.get(direction)
+        if delta is None:
+            valid = False
         else:
+            new_pos = self.player_pos + delta
+            if delta == -1 or delta == 1:
+                valid = new_pos // n == self.player_pos // n
+            else:
+                valid = 0 <= new_pos < n * n
+        if not valid:
             print("You can't move in that direction!")
-            self._log_event(f"Invalid move: {direction}")
+            self._log_event("Invalid move: {}", direction)
             return False
-        
+
         # Move is valid, increment moves counter
         self.moves += 1
-        
+
         # Check what's in the new position
-        item = self.grid[new_pos[0]][new_pos[1]]
+        item = self.grid[new_pos]
         self._handle_item_interaction(item, new_pos)
-        
+
         # Update player position
         self.player_pos = new_pos
-        self._log_event(f"Moved {direction} to position ({new_pos[0]}, {new_pos[1]})")
+        self._log_event("Moved {} to position ({}, {})", direction, new_pos // n, new_pos % n)
         return True
     
     def _handle_item_interaction(self, item, position):
         """
         Handle player interaction with items on the grid.
-        
+
         Args:
-            item (str): The item symbol
-            position (list): [row, col] position of the item
+            item (int): The item byte constant
+            position (int): Flat grid index of the item
         """
-        if item == 'T':  # Treasure
-            self.score += 100
-            print(f"You found a treasure! +100 points")
-            self._log_event(f"Found treasure at ({position[0]}, {position[1]})")
-            self.grid[position[0]][position[1]] = ' '  # Remove treasure
-            
-        elif item == 'X':  # Trap
-            if self.inventory["shields"] > 0:
-                self.inventory["shields"] -= 1
-                print("You triggered a trap, but your shield protected you!")
-                self._log_event(f"Shield used against trap at ({position[0]}, {position[1]})")
-            else:
-                self.score -= 50
-                print("Oh no! You triggered a trap! -50 points")
-                self._log_event(f"Hit by trap at ({position[0]}, {position[1]})")
-            self.grid[position[0]][position[1]] = ' '  # Remove trap
-            
-        elif item == 'K':  # Key
-            self.inventory["keys"] += 1
-            print("You found a key! It might be useful later.")
-            self._log_event(f"Found key at ({position[0]}, {position[1]})")
-            self.grid[position[0]][position[1]] = ' '  # Remove key
-            
-        elif item == 'S':  # Shield
-            self.inventory["shields"] += 1
-            print("You found a shield! This will protect you from one trap.")
-            self._log_event(f"Found shield at ({position[0]}, {position[1]})")
-            self.grid[position[0]][position[1]] = ' '  # Remove shield
-            
-        elif item == 'M':  # Map
-            self.inventory["maps"] += 1
-            print("You found a map! Use it to reveal the entire grid.")
-            self._log_event(f"Found map at ({position[0]}, {position[1]})")
-            self.grid[position[0]][position[1]] = ' '  # Remove map
-            
-        elif item == 'E':  # Exit
-            if self.inventory["keys"] >= 1:
-                self.score += 200
-                print("You've reached the exit and have a key! +200 points")
-                self._log_event("Reached exit with key - Victory!")
-                self.game_over = True
-            else:
-                print("You've found the exit, but you need a key to unlock it!")
-                self._log_event("Found exit but no key")
+        handler = self._HANDLERS.get(item)
+        if handler is not None:
+            handler(self, position)
+
+    def _on_treasure(self, position):
+        """Pick up a treasure for points"""
+        self.score += 100
+        print(f"You found a treasure! +100 points")
+        self._log_event("Found treasure at {}", divmod(position, self.grid_size))
+        self.grid[position] = EMPTY  # Remove treasure
+
+    def _on_trap(self, position):
+        """Trigger a trap, losing points unless a shield absorbs it"""
+        if self.inventory["shields"] > 0:
+            self.inventory["shields"] -= 1
+            print("You triggered a trap, but your shield protected you!")
+            self._log_event("Shield used against trap at {}", divmod(position, self.grid_size))
+        else:
+            self.score -= 50
+            print("Oh no! You triggered a trap! -50 points")
+            self._log_event("Hit by trap at {}", divmod(position, self.grid_size))
+        self.grid[position] = EMPTY  # Remove trap
+
+    def _on_key(self, position):
+        """Pick up a key"""
+        self.inventory["keys"] += 1
+        print("You found a key! It might be useful later.")
+        self._log_event("Found key at {}", divmod(position, self.grid_size))
+        self.grid[position] = EMPTY  # Remove key
+
+    def _on_shield(self, position):
+        """Pick up a shield"""
+        self.inventory["shields"] += 1
+        print("You found a shield! This will protect you from one trap.")
+        self._log_event("Found shield at {}", divmod(position, self.grid_size))
+        self.grid[position] = EMPTY  # Remove shield
+
+    def _on_map(self, position):
+        """Pick up a map"""
+        self.inventory["maps"] += 1
+        print("You found a map! Use it to reveal the entire grid.")
+        self._log_event("Found map at {}", divmod(position, self.grid_size))
+        self.grid[position] = EMPTY  # Remove map
+
+    def _on_exit(self, position):
+        """Reach the exit; wins the game if the player holds a key"""
+        if self.inventory["keys"] >= 1:
+            self.score += 200
+            print("You've reached the exit and have a key! +200 points")
+            self._log_event("Reached exit with key - Victory!")
+            self.game_over = True
+        else:
+            print("You've found the exit, but you need a key to unlock it!")
+            self._log_event("Found exit but no key")
+
+    # Item byte -> handler, looked up in O(1) instead of walking an
+    # if/elif chain of comparisons per move
+    _HANDLERS = {
+        TREASURE: _on_treasure,
+        TRAP: _on_trap,
+        KEY: _on_key,
+        SHIELD: _on_shield,
+        MAP_ITEM: _on_map,
+        EXIT: _on_exit,
+    }
     
     def use_map(self):
         """Allow player to use a map item to reveal the entire grid temporarily"""
         if self.inventory["maps"] > 0:
             self.inventory["maps"] -= 1
-            self.inventory["used_map"] = True
-            print("You used a map! The entire grid is revealed for this turn.")
+            print("You used a map! The entire grid is revealed for 5 seconds.")
             self._log_event("Used map item")
-            self.display_grid(reveal_all=True)
-            time.sleep(5)  # Give player time to see the map
-            self.inventory["used_map"] = False
+            # Set a reveal deadline instead of sleeping; display_grid checks
+            # it, so the game stays responsive while the map is active
+            self.reveal_until = time.monotonic() + 5.0
+            self.display_grid()
             return True
         else:
             print("You don't have any maps to use!")
             return False
     
+    def step(self, action):
+        """
+        Advance the game one move without any console I/O or logging,
+        for driving the game programmatically (bots, benchmarks).
+
+        Args:
+            action (int): 0=up, 1=down, 2=left, 3=right
+
+        Returns:
+            tuple: (reward, done) for the attempted move
+        """
+        inv = [self.inventory["keys"], self.inventory["shields"], self.inventory["maps"]]
+        if _step_kernel_nb is not None:
+            # np.frombuffer shares memory with the bytearray, so the
+            # compiled kernel mutates the grid in place
+            grid = np.frombuffer(self.grid, dtype=np.uint8)
+            inv = np.array(inv, dtype=np.int64)
+            new_pos, reward, done, moved = _step_kernel_nb(
+                grid, self.grid_size, self.player_pos, action, inv)
+        else:
+            new_pos, reward, done, moved = _step_kernel(
+                self.grid, self.grid_size, self.player_pos, action, inv)
+        if moved:
+            self.moves += 1
+            self.player_pos = new_pos
+            self.score += int(reward)
+            self.inventory["keys"] = int(inv[0])
+            self.inventory["shields"] = int(inv[1])
+            self.inventory["maps"] = int(inv[2])
+            if done:
+                self.game_over = True
+        return int(reward), bool(done)
+
     def get_status(self):
         """Return a dictionary with the current game status"""
-        elapsed_time = (datetime.now() - self.start_time).seconds
+        elapsed_time = int(time.monotonic() - self._start_monotonic)
         return {
             "player_name": self.player_name,
             "score": self.score,
@@ -256,17 +457,20 @@ class TreasureHuntGame:
             "grid_size": self.grid_size,
             "score": self.score,
             "moves": self.moves,
-            "player_pos": self.player_pos,
-            "grid": self.grid,
+            "player_pos": list(divmod(self.player_pos, self.grid_size)),
+            "grid": base64.b64encode(bytes(self.grid)).decode(),
+            "grid_fmt": "b64",
             "inventory": self.inventory,
-            "game_log": self.game_log,
+            "game_log": list(self.game_log),
             "saved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
-        # Save to file
-        with open(filename, 'w') as f:
-            json.dump(game_data, f, indent=4)
-        
+        # Serialize once and push the whole payload in a single write
+        # on an 8KB-buffered file
+        blob = _json_dumps(game_data)
+        with open(filename, 'wb', buffering=8192) as f:
+            f.write(blob)
+
         print(f"Game saved to {filename}")
         return True
     
@@ -282,58 +486,82 @@ class TreasureHuntGame:
             TreasureHuntGame: A game instance with the loaded state
         """
         try:
-            with open(filename, 'r') as f:
-                game_data = json.load(f)
-            
+            with open(filename, 'rb') as f:
+                game_data = _json_loads(f.read())
+
             # Create a new game instance
             game = cls(game_data["player_name"], game_data["grid_size"])
             
             # Update the game state
             game.score = game_data["score"]
             game.moves = game_data["moves"]
-            game.player_pos = game_data["player_pos"]
-            game.grid = game_data["grid"]
+            row, col = game_data["player_pos"]
+            game.player_pos = row * game.grid_size + col
+            if game_data.get("grid_fmt") == "b64":
+                game.grid = bytearray(base64.b64decode(game_data["grid"]))
+            else:
+                # Saves from before the flat-grid change stored the grid
+                # as a nested list of one-char strings
+                game.grid = bytearray("".join(map("".join, game_data["grid"])).encode())
             game.inventory = game_data["inventory"]
-            game.game_log = game_data["game_log"]
+            game.game_log = deque(game_data["game_log"], maxlen=256)
             
-            game._log_event(f"Game loaded from {filename}")
+            game._log_event("Game loaded from {}", filename)
             print(f"Game loaded from {filename}")
             return game
-            
-        except (FileNotFoundError, json.JSONDecodeError):
+
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
             print(f"Could not load game from {filename}")
             return None
     
     def generate_game_report(self):
         """Generate a detailed report of the game progress"""
-        elapsed_time = (datetime.now() - self.start_time).seconds
+        elapsed_time = int(time.monotonic() - self._start_monotonic)
         minutes, seconds = divmod(elapsed_time, 60)
         
-        report = f"\n===== GAME REPORT =====\n"
-        report += f"Player: {self.player_name}\n"
-        report += f"Final Score: {self.score}\n"
-        report += f"Moves Made: {self.moves}\n"
-        report += f"Time Played: {minutes}m {seconds}s\n"
-        report += f"Items Collected:\n"
-        report += f"  - Keys: {self.inventory['keys']}\n"
-        report += f"  - Shields: {self.inventory['shields']}\n"
-        report += f"  - Maps: {self.inventory['maps']}\n"
-        
+        # Collect the lines and join once, rather than growing an
+        # immutable string with repeated +=
+        parts = [
+            f"\n===== GAME REPORT =====\n",
+            f"Player: {self.player_name}\n",
+            f"Final Score: {self.score}\n",
+            f"Moves Made: {self.moves}\n",
+            f"Time Played: {minutes}m {seconds}s\n",
+            f"Items Collected:\n",
+            f"  - Keys: {self.inventory['keys']}\n",
+            f"  - Shields: {self.inventory['shields']}\n",
+            f"  - Maps: {self.inventory['maps']}\n",
+        ]
+
         # Calculate efficiency (points per move)
         efficiency = self.score / max(1, self.moves)
-        report += f"Point Efficiency: {efficiency:.2f} points per move\n"
-        
+        parts.append(f"Point Efficiency: {efficiency:.2f} points per move\n")
+
         # Add last 5 game log entries
-        report += "\nRecent Events:\n"
-        for event in self.game_log[-5:]:
-            report += f"  {event}\n"
-            
-        return report
+        parts.append("\nRecent Events:\n")
+        for event in list(self.game_log)[-5:]:
+            parts.append(f"  {event}\n")
+
+        return "".join(parts)
+
+
+def _stdin_reader(command_queue):
+    """
+    Read lines from stdin on a background thread and push them onto the
+    queue, so the main loop can keep updating while waiting for input.
+    A None entry signals that stdin has closed.
+    """
+    while True:
+        try:
+            command_queue.put(input())
+        except EOFError:
+            command_queue.put(None)
+            return
 
 
 def play_game():
     """Main function to start and play the game"""
-    
+
     # Display welcome message and instructions
     print("\n" + "="*50)
     print("WELCOME TO THE PYTHON TREASURE HUNT ADVENTURE!")
@@ -361,15 +589,33 @@ def play_game():
     
     # Initialize game
     game = TreasureHuntGame(player_name)
-    
+
+    # Read commands on a background thread so the main loop never blocks
+    # inside input() and can keep polling game state
+    command_queue = queue.Queue()
+    threading.Thread(target=_stdin_reader, args=(command_queue,), daemon=True).start()
+
+    def next_line(prompt):
+        """Show a prompt and poll the queue for the next line of input"""
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        while True:
+            try:
+                return command_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
     # Main game loop
     while not game.game_over:
         # Display the current state
         game.display_grid()
-        
+
         # Get player command
-        command = input("\nEnter command (up/down/left/right/map/save/load/quit): ").lower()
-        
+        command = next_line("\nEnter command (up/down/left/right/map/save/load/quit): ")
+        if command is None:
+            break
+        command = command.lower()
+
         # Process command
         if command in ["up", "down", "left", "right"]:
             game.move_player(command)
@@ -382,8 +628,8 @@ def play_game():
             if loaded_game:
                 game = loaded_game
         elif command == "quit":
-            confirm = input("Are you sure you want to quit? (y/n): ").lower()
-            if confirm == 'y':
+            confirm = next_line("Are you sure you want to quit? (y/n): ")
+            if confirm is None or confirm.lower() == 'y':
                 print("Thanks for playing!")
                 break
         else:
@@ -416,9 +662,9 @@ def check_high_scores(player_name, score, filename="high_scores.json"):
     """
     # Load existing high scores
     try:
-        with open(filename, 'r') as f:
-            high_scores = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(filename, 'rb') as f:
+            high_scores = _json_loads(f.read())
+    except (FileNotFoundError, ValueError):
         high_scores = []
     
     # Add new score
@@ -428,15 +674,15 @@ def check_high_scores(player_name, score, filename="high_scores.json"):
         "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     })
     
-    # Sort by score (descending)
-    high_scores.sort(key=lambda x: x["score"], reverse=True)
-    
-    # Keep only top 5
-    high_scores = high_scores[:5]
-    
-    # Save back to file
-    with open(filename, 'w') as f:
-        json.dump(high_scores, f, indent=4)
+    # Keep only the top 5, ordered by score (descending), without a full sort
+    high_scores = heapq.nlargest(5, high_scores, key=lambda x: x["score"])
+
+    # Write to a temp file and rename into place, so a crash or Ctrl-C
+    # mid-write can't leave a truncated scores file behind
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, 'wb') as f:
+        f.write(_json_dumps(high_scores))
+    os.replace(tmp_filename, filename)
     
     # Check if this score is in the top 5
     return any(score_entry["player"] == player_name and score_entry["score"] == score for score_entry in high_scores)
@@ -445,14 +691,14 @@ def check_high_scores(player_name, score, filename="high_scores.json"):
 def display_high_scores(filename="high_scores.json"):
     """Display the high scores from a file"""
     try:
-        with open(filename, 'r') as f:
-            high_scores = json.load(f)
-        
+        with open(filename, 'rb') as f:
+            high_scores = _json_loads(f.read())
+
         print("\n===== HIGH SCORES =====")
         for i, score in enumerate(high_scores, 1):
             print(f"{i}. {score['player']}: {score['score']} points ({score['date']})")
-            
-    except (FileNotFoundError, json.JSONDecodeError):
+
+    except (FileNotFoundError, ValueError):
         print("\nNo high scores yet!")
 
 